@@ -1,43 +1,176 @@
 import logging
+import orjson
 import requests
-import os
-from typing import Dict, Any, List, Optional
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Any, Dict, List, Optional
 from utils import detect_language, arabic_to_english
 from database import cache_manager
-from config import HTTP_HEADERS, IPTVEDITOR_TOKEN, IPTVEDITOR_BASE_URL, TMDB_BASE_URL, IPTVEDITOR_PLAYLIST_ID
+from config import HTTP_HEADERS, TMDB_API_KEY, IPTVEDITOR_TOKEN, IPTVEDITOR_BASE_URL, TMDB_BASE_URL, IPTVEDITOR_PLAYLIST_ID, FALLBACK_TO_FIRST_RESULT
+
+# Shared by the HTTP connection pool and the thread fan-out helpers so
+# worker threads never block waiting for a pooled connection
+POOL_SIZE = 20
+
+# Marker row for searches that found nothing, so repeated misses don't
+# re-query TMDB every run
+_NEGATIVE_RESULT = {'__tmdb_not_found__': True}
+
+def _build_session() -> requests.Session:
+    """Create a session with connection pooling and retries for API calls"""
+    session = requests.Session()
+    # Skip per-request environment/proxy/netrc merging; nothing here is
+    # configured through the environment
+    session.trust_env = False
+    # POST is in allowed_methods because the IPTVEditor endpoints are
+    # effectively idempotent (save with the same ids repeats cleanly),
+    # and honoring Retry-After lets TMDB pace us through 429s instead of
+    # the fixed backoff guessing. Jitter keeps the worker threads from
+    # retrying in lockstep; older urllib3 doesn't take the kwarg.
+    retry_kwargs = dict(
+        total=5,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset({'GET', 'POST'}),
+        respect_retry_after_header=True,
+    )
+    try:
+        retries = Retry(backoff_jitter=0.5, **retry_kwargs)
+    except TypeError:
+        retries = Retry(**retry_kwargs)
+    adapter = HTTPAdapter(
+        pool_connections=POOL_SIZE,
+        pool_maxsize=POOL_SIZE,
+        max_retries=retries
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    # Large JSON payloads (show details with images/credits/videos)
+    # compress 5-10x; ask for brotli too since the wheel is installed
+    session.headers.update({
+        'Accept-Encoding': 'gzip, deflate, br',
+        'Connection': 'keep-alive'
+    })
+    return session
+
+def _ok(response: requests.Response) -> None:
+    """Fast-path status check; only falls into raise_for_status on errors"""
+    if response.status_code >= 400:
+        response.raise_for_status()
+
+def _parse(response: requests.Response) -> Any:
+    """Decode a JSON body with orjson straight from the response bytes.
+
+    Skips requests' encoding detection and the stdlib json round-trip;
+    on the larger payloads here that is a measurable chunk of each call.
+    """
+    return orjson.loads(response.content)
+
+@lru_cache(maxsize=None)
+def _language_tag(lang: str) -> str:
+    """Build the BCP 47 tag TMDB expects for a language code.
+
+    Regions are uppercase ('en-US', not 'en-us'); sending the proper
+    casing avoids a normalization pass on TMDB's side and matches their
+    documented examples.
+    """
+    return f"{lang}-{'US' if lang == 'en' else lang.upper()}"
+
+def _coalesce(inflight: Dict, lock: threading.Lock, key, compute):
+    """Run compute() once per key across threads; duplicates wait on the result.
+
+    Returns (owner, value): owner is False when this call piggybacked on
+    a request another thread already had in flight. Exceptions from the
+    owning call propagate to every waiter.
+    """
+    with lock:
+        future = inflight.get(key)
+        owner = future is None
+        if owner:
+            future = Future()
+            inflight[key] = future
+
+    if not owner:
+        return False, future.result()
+
+    try:
+        result = compute()
+        future.set_result(result)
+        return True, result
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with lock:
+            del inflight[key]
 
 class TMDBApi:
     def __init__(self):
-        self.api_key = os.getenv('TMDB_API_KEY', 'a2764023c82b647eac48485b4deac0bf')
+        self.api_key = TMDB_API_KEY
         self.base_url = TMDB_BASE_URL
         self.logger = logging.getLogger(__name__)
+        self.session = _build_session()
+        # Sent with every TMDB request; keep it on the session instead of
+        # rebuilding it into each call's params dict
+        self.session.params = {'api_key': self.api_key}
+        # The search endpoint never changes; build the URL once instead of
+        # re-joining base_url on every call
+        self._search_url = f"{self.base_url}/search/tv"
+        # In-flight request coalescing: duplicate concurrent requests for
+        # the same key wait on the first one instead of hitting TMDB
+        self._inflight: Dict[tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
+        self._coalesced_hits = 0
+        # In-memory LRU tier in front of the SQLite cache; repeated hot
+        # lookups in one run stay a dict probe instead of a DB round-trip
+        self._search_lru = lru_cache(maxsize=4096)(self._search_show)
+        self._details_lru = lru_cache(maxsize=4096)(self._get_show_details)
 
     def search_show(self, title: str) -> Optional[Dict]:
+        """Search for a TV show by title, coalescing duplicate in-flight searches"""
+        owner, result = _coalesce(
+            self._inflight, self._inflight_lock,
+            ('search', title), lambda: self._search_lru(title)
+        )
+        if not owner:
+            self._coalesced_hits += 1
+            self.logger.debug("Coalesced in-flight search for: %s (total: %d)", title, self._coalesced_hits)
+        return result
+
+    def _search_show(self, title: str) -> Optional[Dict]:
         """Search for a TV show by title with improved language handling"""
-        self.logger.debug(f"Searching for show: {title}")
-        
-        # Check cache first
-        cache_key = f"tmdb_search_{title}"
+        self.logger.debug("Searching for show: %s", title)
+
+        # Normalize the key so "Breaking Bad" and " breaking bad " share
+        # one cache row; the cache table already namespaces it
+        cache_key = title.strip().casefold()
         cached_result = cache_manager.get('tmdb_search', cache_key)
-        if cached_result:
+        if cached_result is not None:
+            if cached_result == _NEGATIVE_RESULT:
+                self.logger.debug("Using cached negative search result")
+                return None
             self.logger.debug("Using cached search result")
             return cached_result
         
-        # Detect language
-        lang = detect_language(title)
-        self.logger.debug(f"Detected language for '{title}': {lang}")
+        # Detect language; pure-ASCII titles can't be Arabic, so skip the
+        # regex scan for them (str.isascii is a flag check in CPython)
+        lang = 'en' if title.isascii() else detect_language(title)
+        self.logger.debug("Detected language for '%s': %s", title, lang)
         
         # Try with detected language first
         result = self._search_tmdb(title, lang)
         if result:
-            self.logger.debug(f"Found match in {lang}")
+            self.logger.debug("Found match in %s", lang)
             cache_manager.set('tmdb_search', cache_key, result)
             return result
             
         # If no results and language was Arabic, try English transliteration
         if lang == 'ar':
             transliterated = arabic_to_english(title)
-            self.logger.debug(f"Trying transliterated title: {transliterated}")
+            self.logger.debug("Trying transliterated title: %s", transliterated)
             result = self._search_tmdb(transliterated, 'en')
             if result:
                 self.logger.debug("Found match using transliterated title")
@@ -53,179 +186,372 @@ class TMDBApi:
                 cache_manager.set('tmdb_search', cache_key, result)
                 return result
         
-        self.logger.debug(f"No matches found for '{title}'")
+        self.logger.debug("No matches found for '%s'", title)
+        # Cache the miss too: it cost up to three round-trips and will
+        # repeat every run otherwise. The tmdb_search TTL bounds how long
+        # a miss sticks before the title is retried.
+        cache_manager.set('tmdb_search', cache_key, _NEGATIVE_RESULT)
         return None
 
+    def search_shows_batch(self, titles: List[str], max_workers: int = POOL_SIZE) -> List[Optional[Dict]]:
+        """Search for multiple shows concurrently using a thread pool.
+
+        The searches are I/O-bound, so running them on worker threads that
+        share the pooled session overlaps the TMDB round-trips instead of
+        paying one round-trip per title. requests.Session is thread-safe
+        for this use; the session is created once in __init__ and shared,
+        and the default worker count matches the adapter pool size.
+        """
+        if not titles:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(titles))) as pool:
+            return list(pool.map(self.search_show, titles))
+
+    def search_shows_dedup(self, titles: List[str]) -> List[Optional[Dict]]:
+        """Search a list of titles, deduplicating case-insensitive repeats.
+
+        Duplicate titles are searched once and the results mapped back
+        into the original order, so the batch cost shrinks by whatever
+        the duplication factor is.
+        """
+        unique_map: Dict[str, str] = {}
+        for title in titles:
+            unique_map.setdefault(title.lower(), title)
+
+        results = dict(zip(
+            unique_map.keys(),
+            self.search_shows_batch(list(unique_map.values()))
+        ))
+        return [results[title.lower()] for title in titles]
+
+    def search_shows_bulk(self, titles: List[str], max_workers: int = POOL_SIZE) -> Dict[str, Optional[Dict]]:
+        """Search distinct titles and return a title -> result mapping.
+
+        Convenience over search_shows_batch for callers that index by
+        title rather than position. The worker count stays bounded by
+        the pool size so a large catalog doesn't trip TMDB's rate limit
+        all at once; 429s that do occur are retried by the session's
+        Retry config.
+        """
+        unique_titles = list(dict.fromkeys(titles))
+        results = self.search_shows_batch(unique_titles, max_workers=max_workers)
+        return dict(zip(unique_titles, results))
+
     def _search_tmdb(self, title: str, lang: str) -> Optional[Dict]:
         """Internal method to search TMDB API"""
         params = {
-            'api_key': self.api_key,
             'query': title,
-            'language': f"{lang}-{'us' if lang == 'en' else lang}",
+            'language': _language_tag(lang),
             'include_adult': True
         }
-        
-        response = requests.get(f"{self.base_url}/search/tv", params=params)
-        results = response.json().get('results', [])
+
+        response = self.session.get(self._search_url, params=params)
+        results = _parse(response).get('results', [])
         
         if not results:
             return None
-            
-        # Try to find exact title match first
+
+        # Single pass over the results: an exact title match wins outright,
+        # otherwise remember the first result in the detected language
+        title_lc = title.lower()
+        lang_match = None
         for result in results:
-            if result['name'].lower() == title.lower():
+            if (result.get('name', '').lower() == title_lc
+                    or result.get('original_name', '').lower() == title_lc):
                 return result
-        
+            if lang_match is None and result.get('original_language') == lang:
+                lang_match = result
+
+        if lang_match:
+            return lang_match
+
         # Fallback to first result
-        return results[0]
+        return results[0] if FALLBACK_TO_FIRST_RESULT else None
 
     def get_show_details(self, tmdb_id: int) -> Dict:
         """Get detailed information for a TV show"""
-        self.logger.debug(f"Getting details for TMDB ID: {tmdb_id}")
+        owner, result = _coalesce(
+            self._inflight, self._inflight_lock,
+            ('details', tmdb_id), lambda: self._details_lru(tmdb_id)
+        )
+        if not owner:
+            self._coalesced_hits += 1
+            self.logger.debug("Coalesced in-flight details fetch for ID %s (total: %d)", tmdb_id, self._coalesced_hits)
+        return result
+
+    def _get_show_details(self, tmdb_id: int) -> Dict:
+        self.logger.debug("Getting details for TMDB ID: %s", tmdb_id)
         
         # Check cache first
-        cache_key = f"tmdb_details_{tmdb_id}"
+        cache_key = str(tmdb_id)
         cached_result = cache_manager.get('tmdb_details', cache_key)
         if cached_result:
             self.logger.debug("Using cached show details")
             return cached_result
         
-        self.logger.debug(f"No cache found, fetching details from TMDB API for ID: {tmdb_id}")
-        
+        self.logger.debug("No cache found, fetching details from TMDB API for ID: %s", tmdb_id)
+
         # Get show details from TMDB API
         params = {
-            'api_key': self.api_key,
-            'language': 'en-us',
+            'language': 'en-US',
             'append_to_response': 'images,credits,videos'
         }
-        
-        response = requests.get(f"{self.base_url}/tv/{tmdb_id}", params=params)
-        result = response.json()
-        
-        self.logger.debug(f"Cached details for TMDB ID {tmdb_id}")
+
+        # If a stale copy is still on disk, revalidate with its ETag so an
+        # unchanged show costs a 304 instead of a full body download
+        headers = None
+        stale_result = cache_manager.get_stale('tmdb_details', cache_key)
+        if stale_result is not None:
+            etag = cache_manager.get_stale('tmdb_details', f"{cache_key}_etag")
+            if etag:
+                headers = {'If-None-Match': etag}
+
+        response = self.session.get(f"{self.base_url}/tv/{tmdb_id}", params=params, headers=headers)
+
+        if response.status_code == 304 and stale_result is not None:
+            self.logger.debug("TMDB details unchanged (304) for ID %s", tmdb_id)
+            cache_manager.set('tmdb_details', cache_key, stale_result)
+            return stale_result
+
+        # Parse with orjson directly from the response bytes; the
+        # append_to_response payload runs to tens of KB
+        result = _parse(response)
+
+        self.logger.debug("Cached details for TMDB ID %s", tmdb_id)
+        etag = response.headers.get('ETag')
+        if etag:
+            cache_manager.set('tmdb_details', f"{cache_key}_etag", etag)
         cache_manager.set('tmdb_details', cache_key, result)
+        # Seed the per-section caches so later section-only reads are free
+        for section in ('images', 'credits', 'videos'):
+            if section in result:
+                cache_manager.set('tmdb_details', f"{cache_key}:{section}", result[section])
+        return result
+
+    def get_show_detail_section(self, tmdb_id: int, section: str) -> Optional[Dict]:
+        """Get one append_to_response section (e.g. 'credits') of a show.
+
+        Callers that only need a single section skip the full
+        images+credits+videos payload, which is several times larger.
+        Sections cache under "<id>:<section>" and a full
+        get_show_details fetch seeds them, so mixing the two never
+        refetches.
+        """
+        cache_key = f"{tmdb_id}:{section}"
+        cached_result = cache_manager.get('tmdb_details', cache_key)
+        if cached_result is not None:
+            return cached_result
+
+        response = self.session.get(
+            f"{self.base_url}/tv/{tmdb_id}",
+            params={'language': 'en-US', 'append_to_response': section}
+        )
+        result = _parse(response).get(section)
+        if result is not None:
+            cache_manager.set('tmdb_details', cache_key, result)
         return result
 
 class IPTVEditorApi:
+    # The playlist/token fields never change within a run; build the
+    # fixed payloads and templates once at class definition time
+    _CATEGORIES_PAYLOAD = f'{{"playlist":"{IPTVEDITOR_PLAYLIST_ID}","token":"{IPTVEDITOR_TOKEN}"}}'
+    _SHOWS_PAYLOAD = f'{{"playlist":"{IPTVEDITOR_PLAYLIST_ID}","token":"{IPTVEDITOR_TOKEN}"}}'
+    _EPISODES_TMPL = (b'{"seriesId":"%d","url":null,"playlist":"' + IPTVEDITOR_PLAYLIST_ID.encode()
+                      + b'","token":"' + IPTVEDITOR_TOKEN.encode() + b'"}')
+    _UPDATE_TMPL = (b'{"items":[{"id":%d,"tmdb":%d,"youtube_trailer":"","category":%d}],'
+                    b'"checkSaved":false,"playlist":"' + IPTVEDITOR_PLAYLIST_ID.encode()
+                    + b'","token":"' + IPTVEDITOR_TOKEN.encode() + b'"}')
+
     def __init__(self):
         self.base_url = IPTVEDITOR_BASE_URL
         self.logger = logging.getLogger(__name__)
-        self.headers = HTTP_HEADERS.copy()
+        self.session = _build_session()
+        self.session.headers.update(HTTP_HEADERS)
+        # Coalesce duplicate concurrent episode fetches, same as TMDBApi
+        self._inflight: Dict[tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
 
     def get_categories(self) -> List[Dict]:
         """Get all categories"""
         url = f"{self.base_url}/category/series/get-data"
-        payload = {
-            "playlist": IPTVEDITOR_PLAYLIST_ID,
-            "token": IPTVEDITOR_TOKEN
-        }
+        payload = self._CATEGORIES_PAYLOAD
         
-        self.logger.debug(f"Making POST request to: {url}")
-        self.logger.debug(f"Headers: {self.headers}")
-        self.logger.debug(f"Payload: {payload}")
+        self.logger.debug("Making POST request to: %s", url)
+        self.logger.debug("Headers: %s", self.session.headers)
+        self.logger.debug("Payload: %s", payload)
         
-        response = requests.post(
-            url,
-            headers=self.headers,
-            json=payload
-        )
+        response = self.session.post(url, data=payload)
         
-        self.logger.debug(f"Response status code: {response.status_code}")
-        self.logger.debug(f"Response headers: {response.headers}")
-        self.logger.debug(f"Response content: {response.text}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Response status code: %s", response.status_code)
+            self.logger.debug("Response headers: %s", response.headers)
+            self.logger.debug("Response content: %s", response.text)
         
-        response.raise_for_status()
-        return response.json()['items']
+        _ok(response)
+        return _parse(response)['items']
 
     def get_shows(self) -> List[Dict]:
         """Get all shows"""
         url = f"{self.base_url}/stream/series/get-data"
-        # Format payload as string exactly as provided
-        payload = f'{{"playlist":"{IPTVEDITOR_PLAYLIST_ID}","token":"{IPTVEDITOR_TOKEN}"}}'
+        payload = self._SHOWS_PAYLOAD
         
-        self.logger.debug(f"Making POST request to: {url}")
-        self.logger.debug(f"Headers: {self.headers}")
-        self.logger.debug(f"Payload: {payload}")
+        self.logger.debug("Making POST request to: %s", url)
+        self.logger.debug("Headers: %s", self.session.headers)
+        self.logger.debug("Payload: %s", payload)
         
-        response = requests.post(
-            url,
-            headers=self.headers,
-            data=payload  # Use data instead of json for string payload
-        )
+        response = self.session.post(url, data=payload)  # Use data instead of json for string payload
         
-        self.logger.debug(f"Response status code: {response.status_code}")
-        self.logger.debug(f"Response headers: {response.headers}")
-        self.logger.debug(f"Response content: {response.text}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Response status code: %s", response.status_code)
+            self.logger.debug("Response headers: %s", response.headers)
+            self.logger.debug("Response content: %s", response.text)
         
-        response.raise_for_status()
-        return response.json()['items']
+        _ok(response)
+        return _parse(response)['items']
+
+    def bootstrap(self) -> tuple:
+        """Fetch categories and shows concurrently.
+
+        The two startup requests are independent, so running them on the
+        shared session from two threads costs one round-trip instead of
+        two back to back.
+        """
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            categories_future = pool.submit(self.get_categories)
+            shows_future = pool.submit(self.get_shows)
+            return categories_future.result(), shows_future.result()
 
     def get_episodes(self, show_id: int) -> List[Dict]:
-        """Get episodes for a show"""
-        self.logger.debug(f"Getting episodes for show ID: {show_id}")
+        """Get episodes for a show, coalescing duplicate in-flight fetches"""
+        return _coalesce(
+            self._inflight, self._inflight_lock,
+            ('episodes', show_id), lambda: self._get_episodes(show_id)
+        )[1]
+
+    def _get_episodes(self, show_id: int) -> List[Dict]:
+        self.logger.debug("Getting episodes for show ID: %s", show_id)
         
         # Check cache first
-        cache_key = f"episodes_{show_id}"
+        cache_key = str(show_id)
         cached_result = cache_manager.get('episodes', cache_key)
         if cached_result:
             self.logger.debug("Using cached episodes")
             return cached_result
         
-        self.logger.debug(f"No cache found, fetching episodes from API for show ID: {show_id}")
+        self.logger.debug("No cache found, fetching episodes from API for show ID: %s", show_id)
         
-        # Format payload as string
-        payload = f'{{"seriesId":"{str(show_id)}","url":null,"playlist":"{IPTVEDITOR_PLAYLIST_ID}","token":"{IPTVEDITOR_TOKEN}"}}'
+        # Only seriesId varies; fill it into the prebuilt template
+        payload = self._EPISODES_TMPL % show_id
         
-        response = requests.post(
+        response = self.session.post(
             f"{self.base_url}/episode/get-data",
-            headers=self.headers,
             data=payload  # Use data instead of json
         )
-        result = response.json()['items']
+        result = _parse(response)['items']
         
-        self.logger.debug(f"Cached episodes for show ID {show_id}")
+        self.logger.debug("Cached episodes for show ID %s", show_id)
         cache_manager.set('episodes', cache_key, result)
         return result
 
+    def get_episodes_batch(self, show_ids: List[int], max_workers: int = POOL_SIZE) -> List[List[Dict]]:
+        """Fetch episodes for multiple shows concurrently.
+
+        Same threaded fan-out as TMDBApi.search_shows_batch: episode
+        fetches are independent round-trips, so a batch completes in
+        roughly one RTT instead of one per show.
+        """
+        if not show_ids:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(show_ids))) as pool:
+            return list(pool.map(self.get_episodes, show_ids))
+
     def update_show(self, show_id: int, tmdb_id: int, category_id: int) -> bool:
         """Update a show with TMDB information"""
-        self.logger.debug(f"Updating show ID {show_id} with TMDB ID {tmdb_id}")
+        self.logger.debug("Updating show ID %s with TMDB ID %s", show_id, tmdb_id)
         
         # Check cache first
-        cache_key = f"update_{show_id}_{tmdb_id}"
+        cache_key = f"{show_id}_{tmdb_id}"
         cached_result = cache_manager.get('update', cache_key)
         if cached_result:
             self.logger.debug("Using cached update result")
             return cached_result
         
-        self.logger.debug(f"No cache found, updating show via API: {show_id}")
+        self.logger.debug("No cache found, updating show via API: %s", show_id)
         
-        # Format payload as string
-        payload = f'{{"items":[{{"id":{show_id},"tmdb":{tmdb_id},"youtube_trailer":"","category":{category_id}}}],"checkSaved":false,"playlist":"{IPTVEDITOR_PLAYLIST_ID}","token":"{IPTVEDITOR_TOKEN}"}}'
+        # Only the item fields vary; fill them into the prebuilt template
+        payload = self._UPDATE_TMPL % (show_id, tmdb_id, category_id)
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/stream/series/save",
-                headers=self.headers,
                 data=payload  # Use data instead of json
             )
             
             # Log the full response for debugging
-            self.logger.debug(f"API Response Status: {response.status_code}")
-            self.logger.debug(f"Response headers: {response.headers}")
-            self.logger.debug(f"Response content: {response.text}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("API Response Status: %s", response.status_code)
+                self.logger.debug("Response headers: %s", response.headers)
+                self.logger.debug("Response content: %s", response.text)
             
-            response.raise_for_status()
+            _ok(response)
             
             # Consider 200 status code and "200" response as success
             result = response.status_code == 200 and response.text.strip() == "200"
             
-            self.logger.debug(f"Cached update result for show ID {show_id}")
+            self.logger.debug("Cached update result for show ID %s", show_id)
             cache_manager.set('update', cache_key, result)
             return result
             
         except requests.exceptions.RequestException as e:
-            self.logger.error(f"API request failed: {str(e)}")
+            self.logger.error("API request failed: %s", e)
+            if hasattr(e.response, 'text'):
+                self.logger.error("Error response content: %s", e.response.text)
+            return False
+
+    def update_shows_bulk(self, updates: List[tuple]) -> bool:
+        """Update multiple shows in one POST.
+
+        The save endpoint already takes an "items" list, so a whole batch
+        of (show_id, tmdb_id, category_id) updates costs a single
+        round-trip instead of one per show.
+        """
+        if not updates:
+            return True
+
+        self.logger.debug("Bulk updating %d shows", len(updates))
+
+        items = [
+            {"id": show_id, "tmdb": tmdb_id, "youtube_trailer": "", "category": category_id}
+            for show_id, tmdb_id, category_id in updates
+        ]
+        payload = {
+            "items": items,
+            "checkSaved": False,
+            "playlist": IPTVEDITOR_PLAYLIST_ID,
+            "token": IPTVEDITOR_TOKEN
+        }
+
+        try:
+            response = self.session.post(
+                f"{self.base_url}/stream/series/save",
+                data=orjson.dumps(payload)
+            )
+
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("API Response Status: %s", response.status_code)
+                self.logger.debug("Response content: %s", response.text)
+
+            _ok(response)
+            result = response.status_code == 200 and response.text.strip() == "200"
+
+            if result:
+                # Record each item so per-show update checks hit the cache
+                for show_id, tmdb_id, _ in updates:
+                    cache_manager.set('update', f"{show_id}_{tmdb_id}", True)
+            return result
+
+        except requests.exceptions.RequestException as e:
+            self.logger.error("Bulk update request failed: %s", e)
             if hasattr(e.response, 'text'):
-                self.logger.error(f"Error response content: {e.response.text}")
+                self.logger.error("Error response content: %s", e.response.text)
             return False
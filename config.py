@@ -15,6 +15,7 @@ IPTVEDITOR_PLAYLIST_ID = load_env_var('IPTVEDITOR_PLAYLIST_ID')
 STATE_FILE = "editor_state.json"
 CATEGORIES_FILE = "tvshows-categories.json"
 SHOWS_FILE = "tvshows-shows.json"
+SHOWS_INDEX_FILE = "tvshows-shows-index.json"
 
 # API URLs
 IPTVEDITOR_BASE_URL = "https://editor.iptveditor.com/api"
@@ -40,5 +41,11 @@ HTTP_HEADERS: Dict[str, str] = {
 # Default settings
 DEFAULT_BATCH_SIZE = 10
 
+# How many shows to process between checkpoints. A checkpoint pushes any
+# queued bulk updates to the server and then persists state, so recorded
+# progress never outruns what the server has confirmed; a larger interval
+# only risks re-processing (cached) shows after a hard kill.
+STATE_CHECKPOINT_INTERVAL = 25
+
 # Language settings
 FALLBACK_TO_FIRST_RESULT = True  # Whether to use first result when language doesn't match
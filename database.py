@@ -1,10 +1,55 @@
+import atexit
 import logging
-import json
+import orjson
+import queue
 import sqlite3
+import threading
+import zlib
+from collections import OrderedDict
 from typing import Dict, Any, Optional
 from datetime import datetime, timedelta
 
+# Distinguishes "not in L1" from a cached None
+_L1_MISSING = object()
+
+# Serialized values at or above this size are compressed before hitting
+# SQLite. Show-details payloads run to tens of KB and compress several
+# times over; small rows skip the CPU cost entirely.
+_COMPRESS_THRESHOLD = 4096
+
+def _encode_value(value) -> bytes:
+    """Serialize a cache value, compressing it if it is large"""
+    serialized = orjson.dumps(value)
+    if len(serialized) >= _COMPRESS_THRESHOLD:
+        return zlib.compress(serialized, 6)
+    return serialized
+
+def _decode_value(stored):
+    """Reverse _encode_value; plain JSON rows from older versions pass through"""
+    if isinstance(stored, bytes) and stored[:1] == b'\x78':
+        # zlib header byte; JSON never starts with 'x'
+        stored = zlib.decompress(stored)
+    return orjson.loads(stored)
+
 class CacheManager:
+    # Write-behind tuning: flush queued writes in batches of this size,
+    # or after this many seconds of idleness
+    FLUSH_BATCH_SIZE = 128
+    FLUSH_INTERVAL = 2.0
+
+    # Per-cache-type size of the in-memory L1 front cache
+    L1_MAXSIZE = 4096
+
+    # Freshness windows in seconds. Rows older than this count as misses
+    # (TMDB data and IPTVEditor state do change), but stay on disk so
+    # get_stale can still serve them for ETag revalidation.
+    TTLS = {
+        'tmdb_search': 7 * 24 * 3600,
+        'tmdb_details': 7 * 24 * 3600,
+        'episodes': 24 * 3600,
+        'update': 6 * 3600,
+    }
+
     def __init__(self):
         self.db_file = 'cache.db'
         self.hits = {}
@@ -12,6 +57,36 @@ class CacheManager:
         self.logger = logging.getLogger(__name__)
         self._init_db()
 
+        # One long-lived connection shared by readers and the writer
+        # thread; per-call connect/close defeated SQLite's page cache.
+        # check_same_thread=False is safe because every use holds
+        # _conn_lock, and isolation_level=None leaves transaction
+        # control to the explicit BEGIN in _write_batch.
+        self._conn = sqlite3.connect(
+            self.db_file, check_same_thread=False, isolation_level=None
+        )
+        self._conn_lock = threading.Lock()
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA cache_size=-20000")
+
+        # L1 front cache: hot keys are answered from memory without the
+        # SQLite round-trip or JSON decode. One LRU per cache type.
+        self._l1: Dict[str, OrderedDict] = {}
+        self._l1_lock = threading.Lock()
+
+        # Write-behind buffer: set() enqueues and a daemon thread drains
+        # batches in a single transaction, so the per-call fsync is gone.
+        # _pending keeps queued values visible to get() until written.
+        self._write_queue: queue.Queue = queue.Queue()
+        self._pending: Dict[tuple, tuple] = {}
+        self._pending_lock = threading.Lock()
+        self._write_seq = 0
+        self._writer = threading.Thread(target=self._drain_writes, daemon=True)
+        self._writer.start()
+        atexit.register(self.flush)
+
     def _init_db(self):
         """Initialize SQLite database and create tables if they don't exist"""
         with sqlite3.connect(self.db_file) as conn:
@@ -50,6 +125,17 @@ class CacheManager:
                 )
             ''')
             
+            # Confirmed show -> TMDB mappings; unlike the TTL'd caches
+            # these are durable results and never expire
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS resolved_shows (
+                    show_id INTEGER PRIMARY KEY,
+                    tmdb_id INTEGER,
+                    category_id INTEGER,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
             conn.commit()
 
     def _get_table_name(self, cache_type: str) -> str:
@@ -62,45 +148,218 @@ class CacheManager:
             self.hits[cache_type] = 0
             self.misses[cache_type] = 0
 
+        # L1 first: memory hit costs a dict probe
+        value = self._l1_get(cache_type, key)
+        if value is not _L1_MISSING:
+            self.hits[cache_type] += 1
+            return value
+
+        # A queued-but-unflushed write is still a hit
+        with self._pending_lock:
+            pending = self._pending.get((cache_type, key))
+        if pending is not None:
+            self.hits[cache_type] += 1
+            return pending[0]
+
         table_name = self._get_table_name(cache_type)
+        ttl = self.TTLS.get(cache_type)
         
         try:
-            with sqlite3.connect(self.db_file) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    f"SELECT value FROM {table_name} WHERE key = ?",
-                    (key,)
-                )
-                result = cursor.fetchone()
-                
-                if result:
-                    self.hits[cache_type] += 1
-                    hit_rate = self._calculate_hit_rate(cache_type)
-                    self.logger.debug(f"Cache HIT for {cache_type} (Hit rate: {hit_rate:.1f}%)")
-                    return json.loads(result[0])
+            with self._conn_lock:
+                if ttl is not None:
+                    result = self._conn.execute(
+                        f"SELECT value FROM {table_name} WHERE key = ? AND created_at > datetime('now', ?)",
+                        (key, f"-{ttl} seconds")
+                    ).fetchone()
                 else:
-                    self.misses[cache_type] += 1
-                    hit_rate = self._calculate_hit_rate(cache_type)
-                    self.logger.debug(f"Cache MISS for {cache_type} (Hit rate: {hit_rate:.1f}%)")
-                    return None
+                    result = self._conn.execute(
+                        f"SELECT value FROM {table_name} WHERE key = ?",
+                        (key,)
+                    ).fetchone()
+                
+            if result:
+                self.hits[cache_type] += 1
+                hit_rate = self._calculate_hit_rate(cache_type)
+                self.logger.debug(f"Cache HIT for {cache_type} (Hit rate: {hit_rate:.1f}%)")
+                value = _decode_value(result[0])
+                self._l1_put(cache_type, key, value)
+                return value
+            else:
+                self.misses[cache_type] += 1
+                hit_rate = self._calculate_hit_rate(cache_type)
+                self.logger.debug(f"Cache MISS for {cache_type} (Hit rate: {hit_rate:.1f}%)")
+                return None
                     
         except sqlite3.Error as e:
             self.logger.error(f"Database error: {str(e)}")
             return None
 
-    def set(self, cache_type: str, key: str, value: Any) -> None:
-        """Set value in cache"""
+    def get_stale(self, cache_type: str, key: str) -> Optional[Any]:
+        """Get value from cache even if it would not count as fresh.
+
+        Used for conditional revalidation (ETag) where an out-of-date
+        body is still useful. Does not touch hit/miss statistics.
+        """
+        with self._pending_lock:
+            pending = self._pending.get((cache_type, key))
+        if pending is not None:
+            return pending[0]
+
         table_name = self._get_table_name(cache_type)
-        
+
         try:
-            with sqlite3.connect(self.db_file) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    f"INSERT OR REPLACE INTO {table_name} (key, value) VALUES (?, ?)",
-                    (key, json.dumps(value))
-                )
-                conn.commit()
-                
+            with self._conn_lock:
+                result = self._conn.execute(
+                    f"SELECT value FROM {table_name} WHERE key = ?",
+                    (key,)
+                ).fetchone()
+            return _decode_value(result[0]) if result else None
+
+        except sqlite3.Error as e:
+            self.logger.error(f"Database error: {str(e)}")
+            return None
+
+    def _l1_get(self, cache_type: str, key: str) -> Any:
+        """Look up a key in the L1 front cache; _L1_MISSING if absent"""
+        with self._l1_lock:
+            lru = self._l1.get(cache_type)
+            if lru is None or key not in lru:
+                return _L1_MISSING
+            lru.move_to_end(key)
+            return lru[key]
+
+    def _l1_put(self, cache_type: str, key: str, value: Any) -> None:
+        """Insert a key into the L1 front cache, evicting the coldest entry"""
+        with self._l1_lock:
+            lru = self._l1.setdefault(cache_type, OrderedDict())
+            lru[key] = value
+            lru.move_to_end(key)
+            if len(lru) > self.L1_MAXSIZE:
+                lru.popitem(last=False)
+
+    def set(self, cache_type: str, key: str, value: Any) -> None:
+        """Set value in cache (write-behind; flushed in batches)"""
+        self._l1_put(cache_type, key, value)
+        with self._pending_lock:
+            self._write_seq += 1
+            seq = self._write_seq
+            self._pending[(cache_type, key)] = (value, seq)
+        # Serialized off the caller's path into bytes SQLite stores as-is;
+        # str rows written by older versions still decode fine on read
+        self._write_queue.put((cache_type, key, _encode_value(value), seq))
+
+    def set_many(self, cache_type: str, items) -> None:
+        """Set many (key, value) pairs of one cache type in a single transaction"""
+        rows = []
+        for key, value in items:
+            self._l1_put(cache_type, key, value)
+            rows.append((key, _encode_value(value)))
+        if not rows:
+            return
+
+        try:
+            with self._conn_lock:
+                self._conn.execute("BEGIN")
+                try:
+                    self._conn.executemany(
+                        f"INSERT OR REPLACE INTO {self._get_table_name(cache_type)} (key, value) VALUES (?, ?)",
+                        rows
+                    )
+                    self._conn.execute("COMMIT")
+                except BaseException:
+                    self._conn.execute("ROLLBACK")
+                    raise
+        except sqlite3.Error as e:
+            self.logger.error(f"Database error: {str(e)}")
+
+    def _drain_writes(self) -> None:
+        """Daemon loop draining queued writes in batches"""
+        while True:
+            try:
+                batch = [self._write_queue.get(timeout=self.FLUSH_INTERVAL)]
+            except queue.Empty:
+                continue
+            while len(batch) < self.FLUSH_BATCH_SIZE:
+                try:
+                    batch.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._write_batch(batch)
+
+    def _write_batch(self, batch) -> None:
+        """Write a batch of queued entries in one transaction"""
+        # Group rows by table so each gets one executemany
+        by_table: Dict[str, list] = {}
+        for cache_type, key, serialized, _ in batch:
+            by_table.setdefault(self._get_table_name(cache_type), []).append((key, serialized))
+
+        try:
+            with self._conn_lock:
+                self._conn.execute("BEGIN")
+                try:
+                    for table_name, rows in by_table.items():
+                        self._conn.executemany(
+                            f"INSERT OR REPLACE INTO {table_name} (key, value) VALUES (?, ?)",
+                            rows
+                        )
+                    self._conn.execute("COMMIT")
+                except BaseException:
+                    self._conn.execute("ROLLBACK")
+                    raise
+        except sqlite3.Error as e:
+            self.logger.error(f"Database error: {str(e)}")
+            return
+
+        # Only clear pending entries that were not overwritten since
+        with self._pending_lock:
+            for cache_type, key, _, seq in batch:
+                current = self._pending.get((cache_type, key))
+                if current is not None and current[1] == seq:
+                    del self._pending[(cache_type, key)]
+
+    def flush(self) -> None:
+        """Synchronously flush any queued cache writes (called at exit)"""
+        batch = []
+        while True:
+            try:
+                batch.append(self._write_queue.get_nowait())
+            except queue.Empty:
+                break
+        if batch:
+            self._write_batch(batch)
+
+    def get_resolved(self, show_id: int) -> Optional[tuple]:
+        """Get a show's confirmed (tmdb_id, category_id) mapping, if any"""
+        try:
+            with self._conn_lock:
+                return self._conn.execute(
+                    "SELECT tmdb_id, category_id FROM resolved_shows WHERE show_id = ?",
+                    (show_id,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            self.logger.error(f"Database error: {str(e)}")
+            return None
+
+    def set_resolved(self, show_id: int, tmdb_id: int, category_id: int) -> None:
+        """Record one confirmed show -> TMDB mapping"""
+        self.set_resolved_many([(show_id, tmdb_id, category_id)])
+
+    def set_resolved_many(self, mappings) -> None:
+        """Record confirmed (show_id, tmdb_id, category_id) mappings in one transaction"""
+        if not mappings:
+            return
+        try:
+            with self._conn_lock:
+                self._conn.execute("BEGIN")
+                try:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO resolved_shows (show_id, tmdb_id, category_id) VALUES (?, ?, ?)",
+                        mappings
+                    )
+                    self._conn.execute("COMMIT")
+                except BaseException:
+                    self._conn.execute("ROLLBACK")
+                    raise
         except sqlite3.Error as e:
             self.logger.error(f"Database error: {str(e)}")
 
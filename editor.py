@@ -1,9 +1,18 @@
+from __future__ import annotations
+
+import atexit
+import json
 import logging
 import os
-from typing import Dict, List
+import threading
+from typing import TYPE_CHECKING
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+if TYPE_CHECKING:
+    from typing import Dict, List
 
-from config import STATE_FILE, CATEGORIES_FILE, SHOWS_FILE
+from config import STATE_FILE, CATEGORIES_FILE, SHOWS_FILE, SHOWS_INDEX_FILE, STATE_CHECKPOINT_INTERVAL
 from utils import load_json_file, save_json_file, detect_language, arabic_to_english
 from api import TMDBApi, IPTVEditorApi
 from database import cache_manager
@@ -23,20 +32,50 @@ class IPTVEditor:
         self.shows_by_category = defaultdict(list)
         self.not_found_shows = []  # Track shows not found in TMDB
         
+        # State is checkpointed every STATE_CHECKPOINT_INTERVAL shows
+        # rather than after each one; the atexit hook covers the tail
+        self._shows_since_checkpoint = 0
+
+        # Open lazily on the first journaled not-found show
+        self._nf_journal = None
+
+        # Guards state, processed ids and the not-found list when
+        # process_all runs categories on worker threads
+        self._shared_lock = threading.Lock()
+
+        # Updates queue here and go to the server as one bulk request
+        # per batch instead of one POST per show
+        self._pending_updates = []
+
+        # Resolve the summary-capable handlers once; process_shows used
+        # to rediscover them by walking the root logger every batch
+        self._summary_handlers = [
+            h for h in logging.getLogger().handlers if hasattr(h, 'get_summary')
+        ]
+
         # Load initial data
         self.load_data()
         self.load_state()
         self.load_not_found_shows()
+        atexit.register(self._checkpoint)
         
         # Initialize not_found_shows.json if it doesn't exist
         self.save_not_found_shows()
 
+    def _record_outcome(self, processed: bool) -> None:
+        """Tally one show's outcome directly on the summary handlers"""
+        for handler in self._summary_handlers:
+            if processed:
+                handler.record_success()
+            else:
+                handler.record_failure()
+
     def load_state(self) -> None:
         """Load the processing state from file"""
         try:
             state = load_json_file(STATE_FILE)
             self.state = state
-            self.logger.debug(f"Loaded state: {state}")
+            self.logger.debug("Loaded state: %s", state)
         except FileNotFoundError:
             self.state = {
                 'current_category_id': None,
@@ -44,28 +83,71 @@ class IPTVEditor:
             }
             self.logger.debug("Starting new processing session")
 
+        # Processed ids persist in the state file so pending work lists
+        # can exclude them across runs
+        self._processed_ids = set(self.state.get('processed_ids', []))
+
     def save_state(self) -> None:
-        """Save the current processing state to file"""
-        save_json_file(STATE_FILE, self.state)
-        self.logger.debug(f"Saved state: {self.state}")
+        """Save the current processing state to file (atomic rename)"""
+        with self._shared_lock:
+            self.state['processed_ids'] = sorted(self._processed_ids)
+        # Write-then-rename so a crash mid-write can't truncate the state
+        # file; os.replace is atomic on the same filesystem
+        tmp_file = f"{STATE_FILE}.tmp"
+        save_json_file(tmp_file, self.state)
+        os.replace(tmp_file, STATE_FILE)
+        self._shows_since_checkpoint = 0
+        self.logger.debug("Saved state: %s", self.state)
 
     def load_not_found_shows(self) -> None:
-        """Load existing not found shows from file"""
+        """Load existing not found shows from the aggregate file and journal"""
         try:
             if os.path.exists('not_found_shows.json'):
                 data = load_json_file('not_found_shows.json', raise_on_error=False)
                 if data and 'shows' in data:
                     self.not_found_shows = data['shows']
-                    self.logger.debug(f"Loaded {len(self.not_found_shows)} existing not found shows")
+                    self.logger.debug("Loaded %d existing not found shows", len(self.not_found_shows))
                 else:
                     self.not_found_shows = []
             else:
                 self.not_found_shows = []
                 self.logger.debug("Starting with empty not found shows list")
         except Exception as e:
-            self.logger.error(f"Error loading not found shows: {str(e)}")
+            self.logger.error("Error loading not found shows: %s", e)
             self.not_found_shows = []
 
+        # Membership checks happen per processed show; keep ids in a set
+        # instead of scanning the list each time
+        self._not_found_ids = {s['id'] for s in self.not_found_shows}
+
+        # Merge in journal entries from a run that didn't reach the
+        # aggregate rewrite (crash or kill mid-batch)
+        try:
+            if os.path.exists('not_found_shows.jsonl'):
+                with open('not_found_shows.jsonl', encoding='utf-8') as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        entry = json.loads(line)
+                        if entry['id'] not in self._not_found_ids:
+                            self.not_found_shows.append(entry)
+                            self._not_found_ids.add(entry['id'])
+        except Exception as e:
+            self.logger.error("Error merging not found journal: %s", e)
+
+    def _append_not_found(self, info: Dict) -> None:
+        """Journal one not-found show as a JSONL line.
+
+        Appending a line is far cheaper than rewriting the whole
+        aggregate file per miss; save_not_found_shows folds the journal
+        into not_found_shows.json at the end of each batch.
+        """
+        if self._nf_journal is None:
+            self._nf_journal = open('not_found_shows.jsonl', 'a', encoding='utf-8')
+        self._nf_journal.write(json.dumps(info, ensure_ascii=False) + '\n')
+        self._nf_journal.flush()
+
     def save_not_found_shows(self) -> None:
         """Save shows that weren't found in TMDB to a file"""
         not_found_data = {
@@ -73,20 +155,36 @@ class IPTVEditor:
             'shows': self.not_found_shows
         }
         save_json_file('not_found_shows.json', not_found_data)
+        # Everything journaled is now in the aggregate; reset the journal
+        if self._nf_journal is not None:
+            self._nf_journal.close()
+            self._nf_journal = None
+        if os.path.exists('not_found_shows.jsonl'):
+            os.remove('not_found_shows.jsonl')
         if self.not_found_shows:
-            self.logger.info(f"Saved {len(self.not_found_shows)} not found shows to not_found_shows.json")
+            self.logger.info("Saved %d not found shows to not_found_shows.json", len(self.not_found_shows))
 
     def save_api_data_to_files(self, categories: List[Dict], shows: List[Dict]) -> None:
         """Save API data to JSON files"""
         # Save categories
         categories_data = {'items': categories}
         save_json_file(CATEGORIES_FILE, categories_data)
-        self.logger.info(f"Saved {len(categories)} categories to {CATEGORIES_FILE}")
+        self.logger.info("Saved %d categories to %s", len(categories), CATEGORIES_FILE)
 
         # Save shows
         shows_data = {'items': shows}
         save_json_file(SHOWS_FILE, shows_data)
-        self.logger.info(f"Saved {len(shows)} shows to {SHOWS_FILE}")
+        self.logger.info("Saved %d shows to %s", len(shows), SHOWS_FILE)
+
+        # Persist the category -> show-position index alongside, so
+        # load_data can rebuild the grouping without scanning every show
+        # Keys are stringified to survive the JSON round trip (orjson
+        # rejects int dict keys); the read side undoes it with int()
+        index = defaultdict(list)
+        for position, show in enumerate(shows):
+            index[str(show['category'])].append(position)
+        save_json_file(SHOWS_INDEX_FILE, dict(index))
+        self.logger.debug("Saved category index for %d categories", len(index))
 
     def load_data(self) -> None:
         """Load categories and shows data"""
@@ -95,22 +193,50 @@ class IPTVEditor:
             try:
                 self.logger.debug("Attempting to load from local files")
                 self.categories = load_json_file(CATEGORIES_FILE)['items']
-                self.shows = load_json_file(SHOWS_FILE)['items']
+                # The shows file is by far the largest input; stream its items
+                self.shows = load_json_file(SHOWS_FILE, stream_items=True)['items']
                 self.logger.info("Successfully loaded data from local files")
             except FileNotFoundError:
                 # If files don't exist, fetch from API and save
                 self.logger.info("Local files not found, fetching from API")
-                self.categories = self.iptv_api.get_categories()
-                self.shows = self.iptv_api.get_shows()
+                self.categories, self.shows = self.iptv_api.bootstrap()
                 self.save_api_data_to_files(self.categories, self.shows)
             
-            # Group shows by category
+            # Group shows by category, from the persisted index when it
+            # still matches the loaded shows; scan as the fallback
+            grouped = False
+            index = load_json_file(SHOWS_INDEX_FILE, raise_on_error=False)
+            if index and sum(len(v) for v in index.values()) == len(self.shows):
+                try:
+                    for cat_id, positions in index.items():
+                        self.shows_by_category[int(cat_id)] = [self.shows[p] for p in positions]
+                    grouped = True
+                except (IndexError, ValueError):
+                    self.shows_by_category.clear()
+            if not grouped:
+                for show in self.shows:
+                    self.shows_by_category[show['category']].append(show)
+
+            # Precompute each show's language, and the transliteration
+            # for Arabic names, once at load time; process_show reads the
+            # annotations instead of redoing the work per pass. These are
+            # added after save_api_data_to_files so they never leak into
+            # the shows file.
             for show in self.shows:
-                self.shows_by_category[show['category']].append(show)
+                name = show['name']
+                lang = 'en' if name.isascii() else detect_language(name)
+                show['_lang'] = lang
+                if lang == 'ar':
+                    show['_translit'] = arabic_to_english(name)
+
+            # Index categories by id; the processing paths used to scan
+            # the list with next() on every lookup
+            self._cat_name_by_id = {c['id']: c['name'] for c in self.categories}
+            self._cat_index_by_id = {c['id']: i for i, c in enumerate(self.categories)}
             
-            self.logger.debug(f"Loaded {len(self.categories)} categories and {len(self.shows)} shows")
+            self.logger.debug("Loaded %d categories and %d shows", len(self.categories), len(self.shows))
         except Exception as e:
-            self.logger.error(f"Failed to load data: {str(e)}")
+            self.logger.error("Failed to load data: %s", e)
             raise
 
     def process_show(self, show: Dict) -> bool:
@@ -119,65 +245,69 @@ class IPTVEditor:
         show_name = show['name']
         category_id = show['category']
         
-        self.logger.debug(f"Processing show: {show_name} (ID: {show_id})")
+        self.logger.debug("Processing show: %s (ID: %s)", show_name, show_id)
         
         try:
-            # Get show info from TMDB
+            # Confirmed in an earlier run? Skip the API work entirely
+            if cache_manager.get_resolved(show_id):
+                return True
+
+            # Get show info from TMDB; search_show already falls back to
+            # the transliterated form for Arabic titles and caches the
+            # outcome (hit or miss) under the original name
             show_info = self.tmdb_api.search_show(show_name)
             
-            # If not found, try transliteration for Arabic shows
-            transliterated_name = None
-            if not show_info and detect_language(show_name) == 'ar':
-                transliterated_name = arabic_to_english(show_name)
-                show_info = self.tmdb_api.search_show(transliterated_name)
-            
             if not show_info:
-                self.logger.debug(f"Could not find show '{show_name}' on TMDB")
+                self.logger.debug("Could not find show '%s' on TMDB", show_name)
                 # Add to not found shows list with relevant info
-                category_name = next((c['name'] for c in self.categories if c['id'] == category_id), "Unknown Category")
+                category_name = self._cat_name_by_id.get(category_id, "Unknown Category")
                 not_found_info = {
                     'id': show_id,
                     'name': show_name,  # Original name will be preserved as-is
                     'category_id': category_id,
                     'category_name': category_name
                 }
-                # Add transliterated name if it was attempted
+                # Record the transliterated form for the report
+                transliterated_name = show.get('_translit')
                 if transliterated_name:
                     not_found_info['transliterated_name'] = transliterated_name
                 
                 # Check if show is already in not_found_shows
-                if not any(s['id'] == show_id for s in self.not_found_shows):
-                    self.not_found_shows.append(not_found_info)
-                    self.logger.debug(f"Added show {show_name} to not found list")
-                    # Save after each new not found show
-                    self.save_not_found_shows()
+                with self._shared_lock:
+                    if show_id not in self._not_found_ids:
+                        self.not_found_shows.append(not_found_info)
+                        self._not_found_ids.add(show_id)
+                        self.logger.debug("Added show %s to not found list", show_name)
+                        # Journal the miss; the aggregate is rewritten per batch
+                        self._append_not_found(not_found_info)
                 
-                self.logger.info("✗")
                 return False
             
             show_tmdb_id = show_info['id']
-            self.logger.debug(f"TMDB match - ID: {show_tmdb_id}, Name: {show_info.get('name')}")
+            self.logger.debug("TMDB match - ID: %s, Name: %s", show_tmdb_id, show_info.get('name'))
             
             # Get detailed show information
             show_details = self.tmdb_api.get_show_details(show_tmdb_id)
-            self.logger.debug(f"Retrieved show details from TMDB")
+            self.logger.debug("Retrieved show details from TMDB")
             
             # Get show episodes
             episodes = self.iptv_api.get_episodes(show_id)
-            self.logger.debug(f"Retrieved {len(episodes) if episodes else 0} episodes")
+            self.logger.debug("Retrieved %d episodes", len(episodes) if episodes else 0)
             
-            # Update the show
-            result = self.iptv_api.update_show(show_id, show_tmdb_id, category_id)
-            if result:
-                self.logger.info("✓")
-            else:
-                self.logger.info("✗")
-            return result
+            # Already confirmed by an earlier (possibly bulk) update?
+            if cache_manager.get('update', f"{show_id}_{show_tmdb_id}"):
+                return True
+
+            # Queue the update; _flush_updates sends the whole batch in
+            # one bulk request instead of one POST per show
+            with self._shared_lock:
+                self._pending_updates.append((show_id, show_tmdb_id, category_id))
+            return True
             
         except Exception as e:
-            self.logger.debug(f"Error processing show '{show_name}': {str(e)}")
+            self.logger.debug("Error processing show '%s': %s", show_name, e)
             # Add to not found shows list with error info
-            category_name = next((c['name'] for c in self.categories if c['id'] == category_id), "Unknown Category")
+            category_name = self._cat_name_by_id.get(category_id, "Unknown Category")
             not_found_info = {
                 'id': show_id,
                 'name': show_name,
@@ -187,15 +317,92 @@ class IPTVEditor:
             }
             
             # Check if show is already in not_found_shows
-            if not any(s['id'] == show_id for s in self.not_found_shows):
-                self.not_found_shows.append(not_found_info)
-                self.logger.debug(f"Added show {show_name} to not found list (error: {str(e)})")
-                # Save after each new not found show
-                self.save_not_found_shows()
+            with self._shared_lock:
+                if show_id not in self._not_found_ids:
+                    self.not_found_shows.append(not_found_info)
+                    self._not_found_ids.add(show_id)
+                    self.logger.debug("Added show %s to not found list (error: %s)", show_name, e)
+                    # Journal the miss; the aggregate is rewritten per batch
+                    self._append_not_found(not_found_info)
             
-            self.logger.info("✗")
             return False
 
+    def _flush_updates(self) -> None:
+        """Send queued show updates to the server in one bulk request.
+
+        On failure the affected ids are dropped from the processed set so
+        the next run retries them; their TMDB lookups are all cached by
+        then, so the retry only repeats the save."""
+        with self._shared_lock:
+            updates, self._pending_updates = self._pending_updates, []
+        if not updates:
+            return
+        if self.iptv_api.update_shows_bulk(updates):
+            # Durable record of the confirmed mappings; process_show
+            # skips these shows outright in later runs
+            cache_manager.set_resolved_many(updates)
+        else:
+            self.logger.error("Bulk update failed for %d shows", len(updates))
+            with self._shared_lock:
+                self._processed_ids.difference_update(u[0] for u in updates)
+
+    def _checkpoint(self) -> None:
+        """Flush queued updates, then persist state.
+
+        Order matters: ids in _processed_ids whose updates are still
+        queued must reach the server before the state file records them,
+        or a hard kill right after the save would mark shows done whose
+        updates were never sent."""
+        self._flush_updates()
+        self.save_state()
+
+    def _process_category(self, category_id) -> None:
+        """Process every pending show in one category (worker for process_all)"""
+        pending_shows = [
+            s for s in self.shows_by_category[category_id]
+            if s['id'] not in self._processed_ids and s['id'] not in self._not_found_ids
+        ]
+        for show in pending_shows:
+            try:
+                processed = self.process_show(show)
+            except Exception as e:
+                self.logger.debug("Failed to process show: %s", e)
+                processed = False
+            self.logger.info("%s %s", show['name'], "✓" if processed else "✗")
+            self._record_outcome(processed)
+            with self._shared_lock:
+                if processed:
+                    self._processed_ids.add(show['id'])
+                progress = self.state.setdefault('category_progress', {})
+                progress[str(category_id)] = progress.get(str(category_id), 0) + 1
+                self._shows_since_checkpoint += 1
+                checkpoint_due = self._shows_since_checkpoint >= STATE_CHECKPOINT_INTERVAL
+            # Outside the lock: _checkpoint takes it for the queue swap
+            if checkpoint_due:
+                self._checkpoint()
+
+    def process_all(self, max_workers: int = 4) -> None:
+        """Process all categories concurrently on a small thread pool.
+
+        Categories are independent, so a few of them in flight at once
+        overlap their API round-trips; per-category progress lands in
+        the state file under 'category_progress'. The pool is kept small
+        and rate limiting is left to the session's Retry config, which
+        honors Retry-After on 429s.
+        """
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                list(pool.map(self._process_category, [c['id'] for c in self.categories]))
+        finally:
+            self._checkpoint()
+            self.save_not_found_shows()
+            cache_manager.report_stats()
+            self.logger.debug("detect_language cache: %s", detect_language.cache_info())
+            for handler in self._summary_handlers:
+                summary = handler.get_summary()
+                if summary:
+                    logging.getLogger().info(summary)
+
     def process_shows(self) -> None:
         """Process shows by category in batches"""
         # Get current category or start with first category
@@ -207,58 +414,85 @@ class IPTVEditor:
             self.save_state()
         
         # Get category info
-        category = next((c for c in self.categories if c['id'] == current_category_id), None)
-        if not category:
-            self.logger.error(f"Category {current_category_id} not found")
+        category_name = self._cat_name_by_id.get(current_category_id)
+        if category_name is None:
+            self.logger.error("Category %s not found", current_category_id)
             return
         
-        # Get shows for current category
+        # Shows still pending in this category: already-processed and
+        # known not-found ids are filtered out up front instead of being
+        # revisited and re-skipped batch after batch
         category_shows = self.shows_by_category[current_category_id]
-        if not category_shows:
-            self.logger.info(f"No shows found in category {category['name']}")
+        pending_shows = [
+            s for s in category_shows
+            if s['id'] not in self._processed_ids and s['id'] not in self._not_found_ids
+        ]
+        if not pending_shows:
+            self.logger.info("No pending shows in category %s", category_name)
             # Move to next category
-            next_category_idx = next((i for i, c in enumerate(self.categories) if c['id'] == current_category_id), -1) + 1
+            next_category_idx = self._cat_index_by_id.get(current_category_id, -1) + 1
             if next_category_idx < len(self.categories):
                 self.state['current_category_id'] = self.categories[next_category_idx]['id']
                 self.state['last_processed_index'] = 0
                 self.save_state()
             return
-        
-        start_idx = self.state['last_processed_index']
-        end_idx = min(start_idx + self.batch_size, len(category_shows))
-        
-        self.logger.info(f"Processing category: {category['name']} ({start_idx + 1}-{end_idx} of {len(category_shows)} shows)")
-        
+
+        end_idx = min(self.batch_size, len(pending_shows))
+
+        self.logger.info("Processing category: %s (%d of %d pending shows)", category_name, end_idx, len(pending_shows))
+
+        # Warm the search cache for the whole batch concurrently; the
+        # sequential per-show loop below then answers from cache instead
+        # of paying one TMDB round-trip per show. Failures here are fine —
+        # process_show retries and handles them per show.
         try:
-            for i in range(start_idx, end_idx):
-                show = category_shows[i]
-                self.logger.info(f"[{i + 1}/{len(category_shows)}] {show['name']} ", extra={'terminator': ''})
-                
+            batch_titles = [s['name'] for s in pending_shows[:end_idx]]
+            self.tmdb_api.search_shows_dedup(batch_titles)
+        except Exception as e:
+            self.logger.debug("Batch search warm-up failed: %s", e)
+
+        try:
+            for i, show in enumerate(pending_shows[:end_idx]):
+                processed = False
                 try:
-                    self.process_show(show)
+                    processed = self.process_show(show)
+                    if processed:
+                        self._processed_ids.add(show['id'])
                 except Exception as e:
-                    self.logger.debug(f"Failed to process show: {str(e)}")
+                    self.logger.debug("Failed to process show: %s", e)
                 finally:
-                    # Update state regardless of success/failure
+                    # One record per show: progress and outcome together,
+                    # instead of a half-line relying on a terminator hack
+                    self.logger.info("[%d/%d] %s %s", i + 1, len(pending_shows), show['name'], "✓" if processed else "✗")
+                    self._record_outcome(processed)
+                    # Update state regardless of success/failure; persist
+                    # only at checkpoint intervals instead of every show
                     self.state['last_processed_index'] = i + 1
-                    self.save_state()
+                    self._shows_since_checkpoint += 1
+                    if self._shows_since_checkpoint >= STATE_CHECKPOINT_INTERVAL:
+                        self._checkpoint()
             
-            # If we've processed all shows in this category, move to next category
-            if end_idx >= len(category_shows):
-                next_category_idx = next((i for i, c in enumerate(self.categories) if c['id'] == current_category_id), -1) + 1
+            # If nothing is left pending in this category, move on
+            if end_idx >= len(pending_shows):
+                next_category_idx = self._cat_index_by_id.get(current_category_id, -1) + 1
                 if next_category_idx < len(self.categories):
                     self.state['current_category_id'] = self.categories[next_category_idx]['id']
                     self.state['last_processed_index'] = 0
                     self.save_state()
         finally:
+            # Push queued updates, persist state since the last
+            # checkpoint and fold the not-found journal into the
+            # aggregate file
+            self._checkpoint()
+            self.save_not_found_shows()
+
             # Report cache statistics
             cache_manager.report_stats()
+            self.logger.debug("detect_language cache: %s", detect_language.cache_info())
             
-            # Print processing summary using root logger to access all handlers
-            root_logger = logging.getLogger()
-            for handler in root_logger.handlers:
-                if isinstance(handler, logging.Handler) and hasattr(handler, 'get_summary'):
-                    summary = handler.get_summary()
-                    if summary:
-                        # Use root logger to ensure message goes through all handlers
-                        root_logger.info(summary)
+            # Print processing summary through the root logger so the
+            # message reaches every handler
+            for handler in self._summary_handlers:
+                summary = handler.get_summary()
+                if summary:
+                    logging.getLogger().info(summary)
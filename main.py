@@ -25,7 +25,7 @@ def main():
         editor = IPTVEditor(batch_size=args.batch_size)
         editor.process_shows()
     except Exception as e:
-        logger.error(f"Fatal error: {str(e)}")
+        logger.error("Fatal error: %s", e)
         exit(1)
 
 if __name__ == "__main__":
@@ -1,6 +1,14 @@
-import json
+import atexit
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from api import TMDBApi, IPTVEditorApi
+from utils import save_json_file
+
+# Writes run off the main thread so collection isn't serialized behind
+# disk I/O; shutdown(wait=True) drains pending saves before exit
+_SAVE_POOL = ThreadPoolExecutor(max_workers=2)
+atexit.register(_SAVE_POOL.shutdown, wait=True)
 
 def setup_logging():
     logging.basicConfig(
@@ -9,36 +17,39 @@ def setup_logging():
     )
     return logging.getLogger(__name__)
 
+def _do_save(data, filename):
+    # Compact by default; set PRETTY=1 when the samples need reading
+    save_json_file(f'samples/{filename}', data, indent=os.environ.get('PRETTY') == '1')
+    logging.info("Saved response to samples/%s", filename)
+
 def save_response(data, filename):
-    with open(f'samples/{filename}', 'w') as f:
-        json.dump(data, f, indent=2)
-    logging.info(f"Saved response to samples/{filename}")
+    # Queue the write and keep collecting
+    _SAVE_POOL.submit(_do_save, data, filename)
 
 def main():
     logger = setup_logging()
     tmdb_api = TMDBApi()
     iptv_api = IPTVEditorApi()
 
-    # Collect TMDB search response
-    logger.info("Getting TMDB search response...")
-    search_result = tmdb_api.search_show("Breaking Bad")
-    save_response(search_result, "tmdb/search_show.json")
-
-    # Collect TMDB details response
-    show_id = search_result['id']
-    logger.info(f"Getting TMDB details for show ID {show_id}...")
-    details_result = tmdb_api.get_show_details(show_id)
-    save_response(details_result, "tmdb/show_details.json")
-
-    # Collect IPTV Editor episodes response
-    logger.info("Getting IPTV Editor episodes response...")
-    episodes_result = iptv_api.get_episodes(3816)  # Using a known series ID
-    save_response(episodes_result, "iptveditor/episodes.json")
-
-    # Collect IPTV Editor update show response
-    logger.info("Getting IPTV Editor update show response...")
-    update_result = iptv_api.update_show(3816, show_id, 1)  # Using sample IDs
-    save_response(update_result, "iptveditor/update_show.json")
+    # The four collections form two dependency stages: the search and
+    # the episodes fetch need nothing, details and the update only need
+    # the searched show id. Run each stage's pair concurrently.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        # Collect TMDB search and IPTV Editor episodes responses
+        logger.info("Getting TMDB search and episodes responses...")
+        search_future = pool.submit(tmdb_api.search_show, "Breaking Bad")
+        episodes_future = pool.submit(iptv_api.get_episodes, 3816)  # Using a known series ID
+        search_result = search_future.result()
+        save_response(search_result, "tmdb/search_show.json")
+        save_response(episodes_future.result(), "iptveditor/episodes.json")
+
+        # Collect TMDB details and update show responses
+        show_id = search_result['id']
+        logger.info("Getting TMDB details and update responses for show ID %s...", show_id)
+        details_future = pool.submit(tmdb_api.get_show_details, show_id)
+        update_future = pool.submit(iptv_api.update_show, 3816, show_id, 1)  # Using sample IDs
+        save_response(details_future.result(), "tmdb/show_details.json")
+        save_response(update_future.result(), "iptveditor/update_show.json")
 
 if __name__ == "__main__":
     main()
@@ -1,10 +1,11 @@
-import json
+import orjson
 import os
 import re
 import logging
+import logging.handlers
 import unicodedata
+from functools import lru_cache
 from typing import Any, Dict, Optional
-from arabic_buckwalter_transliteration.transliteration import arabic_to_buckwalter
 
 class MinimalFormatter(logging.Formatter):
     def format(self, record):
@@ -12,6 +13,11 @@ class MinimalFormatter(logging.Formatter):
             return record.getMessage()
         return super().format(record)
 
+# Prebuilt segments for the summary success bar; get_summary slices
+# them instead of rebuilding the strings per call
+_BAR_FULL = '█' * 20
+_BAR_EMPTY = '░' * 20
+
 class SummaryHandler(logging.Handler):
     def __init__(self):
         super().__init__()
@@ -19,15 +25,17 @@ class SummaryHandler(logging.Handler):
         self.shows_failed = 0
         self.current_show = None
     
+    def record_success(self):
+        self.shows_processed += 1
+
+    def record_failure(self):
+        self.shows_processed += 1
+        self.shows_failed += 1
+
     def emit(self, record):
-        if "Processing shows" in record.msg:
-            return  # Skip batch processing messages in summary
-        if record.levelno == logging.INFO:
-            if "✗" in record.msg:
-                self.shows_processed += 1
-                self.shows_failed += 1
-            elif "✓" in record.msg:
-                self.shows_processed += 1
+        # Outcomes are reported through record_success/record_failure;
+        # nothing is scraped from the log stream anymore
+        pass
     
     def get_summary(self):
         if self.shows_processed == 0:
@@ -37,9 +45,8 @@ class SummaryHandler(logging.Handler):
         success_rate = (success_count / self.shows_processed * 100) if self.shows_processed > 0 else 0
         
         # Create visual bar for success rate
-        bar_length = 20
-        filled_length = int(bar_length * success_rate / 100)
-        bar = '█' * filled_length + '░' * (bar_length - filled_length)
+        filled_length = int(len(_BAR_FULL) * success_rate / 100)
+        bar = _BAR_FULL[:filled_length] + _BAR_EMPTY[filled_length:]
         
         return f"""
 ╔══════════════ Processing Summary ══════════════╗
@@ -64,13 +71,18 @@ def setup_logging() -> logging.Logger:
     # Create logs directory if it doesn't exist
     os.makedirs('logs', exist_ok=True)
     
-    # File handler for detailed logs
+    # File handler for detailed logs, buffered in memory so the chatty
+    # debug stream isn't a disk write per record; errors flush
+    # immediately and logging.shutdown drains the rest at exit
     file_handler = logging.FileHandler('logs/detailed.log')
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     ))
-    
+    buffered_file_handler = logging.handlers.MemoryHandler(
+        capacity=1024, flushLevel=logging.ERROR, target=file_handler
+    )
+
     # Console handler for minimal progress only
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
@@ -81,65 +93,117 @@ def setup_logging() -> logging.Logger:
     summary_handler.setLevel(logging.INFO)
     
     # Add all handlers
-    logger.addHandler(file_handler)
+    logger.addHandler(buffered_file_handler)
     logger.addHandler(console_handler)
     logger.addHandler(summary_handler)
     
     return logger
 
-def load_json_file(filepath: str, raise_on_error: bool = True) -> Optional[Dict[str, Any]]:
-    """Load and parse JSON file"""
+def load_json_file(filepath: str, raise_on_error: bool = True,
+                   stream_items: bool = False) -> Optional[Dict[str, Any]]:
+    """Load and parse JSON file.
+
+    With stream_items=True the top-level 'items' array is parsed
+    incrementally with ijson, so a large file never sits in memory as
+    raw text alongside its fully parsed tree.
+    """
     try:
-        with open(filepath, encoding='utf-8') as f:
-            return json.load(f)
+        if stream_items:
+            import ijson  # only the large-file path needs it
+            with open(filepath, 'rb', buffering=65536) as f:
+                return {'items': list(ijson.items(f, 'items.item'))}
+        with open(filepath, 'rb', buffering=65536) as f:
+            return orjson.loads(f.read())
     except FileNotFoundError:
         if raise_on_error:
-            logging.error(f"File not found: {filepath}")
+            logging.error("File not found: %s", filepath)
             raise
         return None
-    except json.JSONDecodeError:
+    except ValueError:
+        # Covers orjson.JSONDecodeError and ijson's parse errors alike
         if raise_on_error:
-            logging.error(f"Invalid JSON in file: {filepath}")
+            logging.error("Invalid JSON in file: %s", filepath)
             raise
         return None
 
-def save_json_file(filepath: str, data: Dict[str, Any]) -> None:
-    """Save data to JSON file with proper UTF-8 encoding"""
+# Directories save_json_file has already created or verified this run
+_KNOWN_DIRS = set()
+
+def save_json_file(filepath: str, data: Dict[str, Any], indent: bool = True) -> None:
+    """Save data to JSON file with proper UTF-8 encoding.
+
+    indent=False writes compact JSON, which is smaller and faster for
+    files nobody reads by hand.
+    """
     try:
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(filepath) or '.', exist_ok=True)
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        # Ensure directory exists; directories already seen this run
+        # skip the stat/mkdir syscalls
+        dirpath = os.path.dirname(filepath) or '.'
+        if dirpath not in _KNOWN_DIRS:
+            os.makedirs(dirpath, exist_ok=True)
+            _KNOWN_DIRS.add(dirpath)
+        # orjson serializes several times faster than the stdlib and
+        # emits UTF-8 bytes directly (non-ASCII stays literal, matching
+        # the old ensure_ascii=False behavior); one write per document
+        serialized = orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+        with open(filepath, 'wb', buffering=65536) as f:
+            f.write(serialized)
     except Exception as e:
-        logging.error(f"Failed to save file {filepath}: {str(e)}")
+        logging.error("Failed to save file %s: %s", filepath, e)
         raise
 
+@lru_cache(maxsize=None)
 def load_env_var(key: str, default: str = None) -> str:
     """
     Load environment variable with error handling.
     Raises ValueError if required variable is missing.
+
+    Cached: the environment is read once per key and treated as
+    immutable for the life of the process.
     """
     value = os.getenv(key, default)
     if value is None:
         raise ValueError(f"Required environment variable {key} is not set")
     return value
 
+# Arabic Unicode ranges; compiled once at import rather than per call
+_ARABIC_RE = re.compile(r'[\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF]+')
+
+# Whitespace runs, for normalizing transliterated titles
+_WS_RE = re.compile(r'\s+')
+
+@lru_cache(maxsize=8192)
 def detect_language(text: str) -> str:
     """Detect if text contains Arabic characters"""
-    # Arabic Unicode range
-    arabic_pattern = re.compile(r'[\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF]+')
-    return 'ar' if arabic_pattern.search(text) else 'en'
+    # Pure-ASCII text can't contain Arabic; isascii is a flag check in
+    # CPython, so this answers most English titles without the regex
+    if text.isascii():
+        return 'en'
+    return 'ar' if _ARABIC_RE.search(text) else 'en'
+
+# Buckwalter transliteration table (Arabic letter -> ASCII). Applying it
+# with str.translate is a single C-level pass and replaces the
+# arabic_buckwalter_transliteration import, which was never declared in
+# requirements.txt.
+_BUCKWALTER_TABLE = str.maketrans({
+    'ء': "'", 'آ': '|', 'أ': '>', 'ؤ': '&', 'إ': '<', 'ئ': '}',
+    'ا': 'A', 'ب': 'b', 'ة': 'p', 'ت': 't', 'ث': 'v', 'ج': 'j',
+    'ح': 'H', 'خ': 'x', 'د': 'd', 'ذ': '*', 'ر': 'r', 'ز': 'z',
+    'س': 's', 'ش': '$', 'ص': 'S', 'ض': 'D', 'ط': 'T', 'ظ': 'Z',
+    'ع': 'E', 'غ': 'g', 'ف': 'f', 'ق': 'q', 'ك': 'k', 'ل': 'l',
+    'م': 'm', 'ن': 'n', 'ه': 'h', 'و': 'w', 'ى': 'Y', 'ي': 'y',
+    'ً': 'F', 'ٌ': 'N', 'ٍ': 'K', 'َ': 'a', 'ُ': 'u', 'ِ': 'i',
+    'ّ': '~', 'ْ': 'o', 'ٰ': '`', 'ٱ': '{', 'پ': 'P', 'چ': 'J',
+    'ڤ': 'V', 'گ': 'G',
+})
 
+@lru_cache(maxsize=2048)
 def arabic_to_english(text: str) -> str:
     """
     Convert Arabic text to a searchable English form using Buckwalter transliteration.
     This provides a standardized way to convert Arabic text to ASCII.
     """
-    try:
-        # Convert Arabic text to Buckwalter transliteration
-        transliterated = arabic_to_buckwalter(text)
-        # Clean up the result - remove double spaces and trailing spaces
-        return ' '.join(transliterated.split())
-    except Exception as e:
-        logging.error(f"Error in arabic_to_english: {str(e)}")
-        return text  # Return original text if conversion fails
+    transliterated = text.translate(_BUCKWALTER_TABLE)
+    # Clean up the result - collapse runs of whitespace in place instead
+    # of building a word list just to rejoin it
+    return _WS_RE.sub(' ', transliterated).strip()